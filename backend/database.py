@@ -1,42 +1,123 @@
 """
-Database operations for lead management using JSON file storage.
+Database operations for lead management using an append-only log.
 
-This module handles all CRUD operations for leads, using a JSON file
-as the data store with thread-safe operations.
+This module handles all CRUD operations for leads. Leads are stored in a
+newline-delimited JSON log where every mutation appends one record, and
+the log is periodically compacted back down to one record per lead.
 """
 
-import json
 import os
-from typing import List, Optional, Dict
+import threading
+from bisect import bisect_right
+from functools import lru_cache
+from collections import Counter
+from contextlib import contextmanager
+from typing import BinaryIO, Iterable, Iterator, List, Optional, Dict, Set, Tuple
 from datetime import datetime
 import uuid
 from pathlib import Path
 
-from models import Lead, LeadCreate, LeadUpdate, Activity, ActivityType
+import orjson
+
+try:
+    import fcntl
+except ImportError:
+    # Not available on Windows; cross-process locking is skipped there
+    fcntl = None
+
+from models import Lead, LeadCreate, LeadUpdate, LeadStatus, Activity, ActivityType
 
 
 # Check if running on Vercel
 IS_VERCEL = os.environ.get('VERCEL_ENV') is not None
 
-# Path to the JSON data file
+# Path to the data files
 if IS_VERCEL:
     # On Vercel, use /tmp directory which is writable
     DATA_DIR = Path("/tmp")
 else:
     DATA_DIR = Path(__file__).parent.parent / "data"
 
-LEADS_FILE = DATA_DIR / "leads.json"
+LEADS_FILE = DATA_DIR / "leads.ndjson"
+
+# Single-document JSON file used before the log format; migrated on first run
+LEGACY_LEADS_FILE = DATA_DIR / "leads.json"
+
+# Compact the log once it grows past this multiple of its live data
+COMPACTION_RATIO = 2
+
+# Write-behind: buffered records are flushed by a background thread every
+# FLUSH_INTERVAL seconds, or as soon as FLUSH_BATCH of them are waiting
+FLUSH_INTERVAL = 0.5
+FLUSH_BATCH = 32
+
+# Separates fields in a search blob so matches can't span two fields
+_SEARCH_SEP = "\x00"
+
+# In-memory copy of the replayed log, keyed on the file's mtime and size so
+# that reads skip JSON decoding and model validation while the file is unchanged.
+# email_index maps a lowercased email to the ids of every lead using it,
+# id_index maps a lead id to its position in the leads list, and the
+# status/company/tag counts back get_stats() and get_tag_counts().
+# search_blobs runs parallel to leads and holds each lead's lowercased
+# searchable fields; search_joined/search_offsets concatenate them into one
+# buffer (rebuilt lazily, None when stale) so a search is a few bytes.find()
+# calls. version changes whenever the cached leads do and keys the search
+# result cache. record_bytes holds the size each lead would take in a
+# compacted log and live_bytes their sum.
+_CACHE = {
+    "mtime_ns": -1,
+    "size": -1,
+    "leads": None,
+    "email_index": {},
+    "id_index": {},
+    "search_blobs": [],
+    "search_joined": None,
+    "search_offsets": [],
+    "version": 0,
+    "status_counts": {},
+    "company_counts": Counter(),
+    "tag_counts": Counter(),
+    "record_bytes": {},
+    "live_bytes": 0,
+}
+_CACHE_LOCK = threading.RLock()
+
+# Encoded records not yet written to the log. While any are waiting the
+# cache is the source of truth and is not reloaded from disk.
+_PENDING: List[bytes] = []
+# Flushes that have taken records off _PENDING and not yet finished; the
+# cache is not reloaded while any are under way either
+_IN_FLIGHT = 0
+_FLUSH_WAKEUP = threading.Event()
+_FLUSH_STOP = threading.Event()
+_FLUSHER: Optional[threading.Thread] = None
+
+# Handle on the log kept open between calls (see _locked_log). _LOG_LOCK
+# guards it and keeps flushes in order; take it after _CACHE_LOCK, never
+# before.
+_LOG_FD: Optional[BinaryIO] = None
+_LOG_LOCK = threading.RLock()
 
 
 def ensure_data_file_exists() -> None:
     """
-    Ensure the leads.json file exists, create with empty structure if not.
+    Ensure the leads log exists, create it if not.
+
+    An existing legacy leads.json is migrated into the log; otherwise the
+    log is seeded with sample data.
 
     Side Effects:
-        Creates data directory and leads.json if they don't exist
+        Creates data directory and leads.ndjson if they don't exist
     """
     DATA_DIR.mkdir(parents=True, exist_ok=True)
-    if not LEADS_FILE.exists():
+    if LEADS_FILE.exists():
+        return
+
+    if LEGACY_LEADS_FILE.exists():
+        with open(LEGACY_LEADS_FILE, 'rb') as f:
+            initial_data = orjson.loads(f.read())
+    else:
         # Initialize with sample data
         initial_data = {
             "leads": [
@@ -63,28 +144,226 @@ def ensure_data_file_exists() -> None:
                 }
             ]
         }
-        with open(LEADS_FILE, 'w') as f:
-            json.dump(initial_data, f, indent=2)
+
+    # Another worker may be creating the log at the same time; only the
+    # first one to finish gets to install its copy
+    _write_log(initial_data.get('leads', []), overwrite=False)
+
+
+@contextmanager
+def _locked_log(exclusive: bool) -> Iterator[Tuple[BinaryIO, os.stat_result]]:
+    """
+    Hold the log's advisory lock and yield its open handle and fstat.
+
+    The handle is opened once and reused. If another process compacted the
+    log in the meantime, the handle points at the replaced file (no links
+    left) and is reopened on the new one.
+
+    Parameters:
+        exclusive: Take an exclusive (write) lock instead of a shared one
+
+    Yields:
+        Tuple[BinaryIO, os.stat_result]: The log handle and its status
+    """
+    global _LOG_FD
+
+    with _LOG_LOCK:
+        while True:
+            if _LOG_FD is None:
+                ensure_data_file_exists()
+                _LOG_FD = open(LEADS_FILE, 'a+b')
+            f = _LOG_FD
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+            st = os.fstat(f.fileno())
+            if st.st_nlink > 0:
+                break
+            f.close()
+            _LOG_FD = None
+
+        try:
+            yield f, st
+        finally:
+            if not f.closed:
+                if fcntl is not None:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+                if f is not _LOG_FD:
+                    f.close()
+
+
+def _encode_record(record: Dict) -> bytes:
+    """
+    Encode a single log record as one newline-terminated line.
+
+    orjson serializes datetimes (as ISO 8601) and enums natively, so model
+    dumps can be passed straight through.
+
+    Parameters:
+        record: Log record, e.g. {"op": "put", "lead": {...}}
+
+    Returns:
+        bytes: Encoded line including the trailing newline
+    """
+    return orjson.dumps(record) + b"\n"
+
+
+def _write_log(lead_records: Iterable[Dict], overwrite: bool = True) -> Dict[str, int]:
+    """
+    Atomically replace the log with one put record per lead.
+
+    Parameters:
+        lead_records: Serialized leads to write
+        overwrite: Replace an existing log; if False, leave it in place
+
+    Returns:
+        Dict[str, int]: Size in bytes of each lead's record, keyed by lead ID
+
+    Side Effects:
+        Rewrites leads.ndjson via a temp file and rename
+    """
+    record_bytes = {}
+
+    # Atomic write: write to temp file (unique per process), then rename
+    temp_file = LEADS_FILE.with_suffix(f'.{os.getpid()}.tmp')
+    try:
+        with open(temp_file, 'wb') as f:
+            for lead_record in lead_records:
+                line = _encode_record({"op": "put", "lead": lead_record})
+                f.write(line)
+                record_bytes[lead_record['id']] = len(line)
+            f.flush()
+            os.fsync(f.fileno())
+        if overwrite:
+            temp_file.replace(LEADS_FILE)
+        else:
+            try:
+                os.link(temp_file, LEADS_FILE)
+            except FileExistsError:
+                pass
+            temp_file.unlink()
+    except Exception as e:
+        if temp_file.exists():
+            temp_file.unlink()
+        raise e
+
+    return record_bytes
 
 
 def load_leads() -> List[Lead]:
     """
-    Load all leads from the JSON file.
+    Load all leads by replaying the log.
 
     Returns:
         List[Lead]: List of all leads in the system
 
     Raises:
-        FileNotFoundError: If leads file doesn't exist
-        json.JSONDecodeError: If file contains invalid JSON
+        orjson.JSONDecodeError: If the log contains an invalid record
+    """
+    with _CACHE_LOCK:
+        _refresh_cache()
+        return list(_CACHE["leads"])
+
+
+def _refresh_cache() -> None:
+    """
+    Replay the log into the cache if the file changed since it was filled.
+
+    Side Effects:
+        Replaces the cached leads and indexes when the file is stale
+    """
+    with _CACHE_LOCK:
+        if _PENDING or _IN_FLIGHT:
+            return
+
+        with _locked_log(exclusive=False) as (f, st):
+            _reload_if_stale(f, st)
+
+
+def _reload_if_stale(f: BinaryIO, st: os.stat_result) -> None:
     """
-    ensure_data_file_exists()
+    Replay the log into the cache unless it still matches the file.
 
-    with open(LEADS_FILE, 'r') as f:
-        data = json.load(f)
+    Parameters:
+        f: Log handle, locked by the caller
+        st: Status of the log handle
+
+    Side Effects:
+        Replaces the cached leads and indexes when the file is stale
+    """
+    with _CACHE_LOCK:
+        if st.st_mtime_ns == _CACHE["mtime_ns"] and st.st_size == _CACHE["size"]:
+            return
+
+        f.seek(0)
+        data = f.read()
+
+        # A crash mid-append can leave an unterminated last record. It was
+        # never acknowledged, so skip it; flush() trims it before writing.
+        data = data[:data.rfind(b"\n") + 1]
+
+        # Replay in order; a later put for an ID replaces the earlier one
+        # but keeps its position, so leads stay in creation order. Patches
+        # are merged onto whatever record the ID currently has.
+        lead_records: Dict[str, Dict] = {}
+        record_bytes: Dict[str, int] = {}
+        for line in data.splitlines():
+            if not line.strip():
+                continue
+            record = orjson.loads(line)
+            if record['op'] == 'put':
+                lead_id = record['lead']['id']
+                lead_records[lead_id] = record['lead']
+                record_bytes[lead_id] = len(line) + 1
+            elif record['op'] == 'patch':
+                lead_record = lead_records.get(record['id'])
+                if lead_record is not None:
+                    lead_record.update(record['fields'])
+                    lead_record.setdefault('activity_history', []).extend(
+                        record['activities']
+                    )
+                    record_bytes[record['id']] += _activities_size(
+                        record['activities']
+                    )
+            elif record['op'] == 'del':
+                lead_records.pop(record['id'], None)
+                record_bytes.pop(record['id'], None)
+
+        snapshot = _parse_leads(lead_records.values())
+        snapshot.update({
+            "version": _CACHE["version"] + 1,
+            "mtime_ns": st.st_mtime_ns,
+            "size": st.st_size,
+            "record_bytes": record_bytes,
+            "live_bytes": sum(record_bytes.values()),
+        })
+        _CACHE.update(snapshot)
+
+
+def _parse_leads(lead_records: Iterable[Dict]) -> Dict:
+    """
+    Build lead models, lookup indexes and counts in a single pass.
+
+    The log only ever holds data that already passed validation on its way
+    in, so models are built with model_construct() instead of being
+    re-validated. That skips type coercion too, which is why datetimes and
+    enums are converted here by hand.
 
+    Parameters:
+        lead_records: Serialized leads, in order
+
+    Returns:
+        Dict: Parsed leads plus the indexes and counts built alongside them,
+            under the same keys they have in the cache
+    """
     leads = []
-    for lead_data in data.get('leads', []):
+    id_index: Dict[str, int] = {}
+    email_index: Dict[str, Set[str]] = {}
+    search_blobs: List[str] = []
+    status_counts = {status.value: 0 for status in LeadStatus}
+    company_counts: Counter = Counter()
+    tag_counts: Counter = Counter()
+
+    for lead_data in lead_records:
         # Parse datetime strings
         if isinstance(lead_data.get('date_added'), str):
             lead_data['date_added'] = datetime.fromisoformat(
@@ -94,6 +373,8 @@ def load_leads() -> List[Lead]:
             lead_data['last_contacted'] = datetime.fromisoformat(
                 lead_data['last_contacted']
             )
+        if 'status' in lead_data:
+            lead_data['status'] = LeadStatus(lead_data['status'])
 
         # Parse activity history
         if 'activity_history' in lead_data:
@@ -103,55 +384,435 @@ def load_leads() -> List[Lead]:
                     activity_data['timestamp'] = datetime.fromisoformat(
                         activity_data['timestamp']
                     )
-                activities.append(Activity(**activity_data))
+                activity_data['type'] = ActivityType(activity_data['type'])
+                activities.append(Activity.model_construct(**activity_data))
             lead_data['activity_history'] = activities
 
-        leads.append(Lead(**lead_data))
+        lead = Lead.model_construct(**lead_data)
+        lead_id = lead.id
 
-    return leads
+        # Same bookkeeping as _index_lead, inlined for the bulk load
+        id_index[lead_id] = len(leads)
+        leads.append(lead)
+        email_index.setdefault(lead.email.lower(), set()).add(lead_id)
+        status_counts[lead.status.value] += 1
+        company_counts[lead.company_name] += 1
+        tag_counts.update(lead.tags)
+        search_blobs.append(_search_blob(lead))
+
+    return {
+        "leads": leads,
+        "id_index": id_index,
+        "email_index": email_index,
+        "search_blobs": search_blobs,
+        # Joined lazily by _search_buffer on the first search
+        "search_joined": None,
+        "search_offsets": [],
+        "status_counts": status_counts,
+        "company_counts": company_counts,
+        "tag_counts": tag_counts,
+    }
 
 
-def save_leads(leads: List[Lead]) -> None:
+def _search_blob(lead: Lead) -> str:
     """
-    Save all leads to the JSON file with atomic write operation.
+    Build the lowercased text that search queries are matched against.
 
     Parameters:
-        leads: List of leads to save
+        lead: Lead to build the blob for
+
+    Returns:
+        str: Company name, contact name and email, lowercased
+    """
+    return _SEARCH_SEP.join(
+        (lead.company_name, lead.contact_name, lead.email)
+    ).lower()
+
+
+def _search_buffer() -> Tuple[bytes, List[int]]:
+    """
+    Get all search blobs joined into one buffer, rebuilding it if stale.
+
+    Returns:
+        Tuple[bytes, List[int]]: The joined UTF-8 buffer and the start
+            offset of each blob in it
+    """
+    with _CACHE_LOCK:
+        if _CACHE["search_joined"] is None:
+            sep = _SEARCH_SEP.encode()
+            offsets = []
+            pos = 0
+            encoded = []
+            for blob in _CACHE["search_blobs"]:
+                data = blob.encode()
+                offsets.append(pos)
+                encoded.append(data)
+                pos += len(data) + len(sep)
+            _CACHE["search_joined"] = sep.join(encoded)
+            _CACHE["search_offsets"] = offsets
+        return _CACHE["search_joined"], _CACHE["search_offsets"]
+
+
+def _index_lead(indexes: Dict, lead: Lead) -> None:
+    """
+    Add a lead to the email index and the status/company/tag counts.
+
+    Parameters:
+        indexes: The cache, or a dict with the same index keys
+        lead: Lead to add
+    """
+    indexes["email_index"].setdefault(lead.email.lower(), set()).add(lead.id)
+    indexes["status_counts"][lead.status.value] += 1
+    indexes["company_counts"][lead.company_name] += 1
+    indexes["tag_counts"].update(lead.tags)
+
+
+def _unindex_lead(indexes: Dict, lead: Lead) -> None:
+    """
+    Remove a lead from the email index and the status/company/tag counts.
+
+    Parameters:
+        indexes: The cache, or a dict with the same index keys
+        lead: Lead to remove
+    """
+    email_index = indexes["email_index"]
+    email_lower = lead.email.lower()
+    owners = email_index.get(email_lower)
+    if owners is not None:
+        owners.discard(lead.id)
+        if not owners:
+            del email_index[email_lower]
+
+    indexes["status_counts"][lead.status.value] -= 1
+
+    company_counts = indexes["company_counts"]
+    company_counts[lead.company_name] -= 1
+    if company_counts[lead.company_name] <= 0:
+        del company_counts[lead.company_name]
+
+    tag_counts = indexes["tag_counts"]
+    tag_counts.subtract(lead.tags)
+    for tag in lead.tags:
+        if tag_counts.get(tag, 0) <= 0:
+            tag_counts.pop(tag, None)
+
+
+def append_record(op: str, lead: Lead) -> None:
+    """
+    Append a single mutation record to the log.
+
+    Parameters:
+        op: "put" to store the lead, "del" to remove it
+        lead: Lead the record applies to
 
     Side Effects:
-        Writes to leads.json file atomically
-    """
-    ensure_data_file_exists()
-
-    # Convert leads to dictionaries
-    leads_data = {
-        "leads": [
-            {
-                **lead.model_dump(),
-                "date_added": lead.date_added.isoformat(),
-                "last_contacted": lead.last_contacted.isoformat() if lead.last_contacted else None,
-                "activity_history": [
-                    {
-                        **activity.model_dump(),
-                        "timestamp": activity.timestamp.isoformat()
-                    }
-                    for activity in lead.activity_history
-                ]
-            }
-            for lead in leads
-        ]
-    }
+        Queues one line for leads.ndjson (see _append_line)
+    """
+    if op == 'put':
+        line = _encode_record({"op": "put", "lead": lead.model_dump()})
+    elif op == 'del':
+        line = _encode_record({"op": "del", "id": lead.id})
+    else:
+        raise ValueError(f"Unknown log operation: {op}")
+
+    _append_line(op, lead.id, line)
+
+
+def append_patch(lead_id: str, fields: Dict, activities: List[Activity]) -> None:
+    """
+    Append a delta record holding only the changed fields of a lead.
+
+    Parameters:
+        lead_id: ID of the lead the patch applies to
+        fields: Changed fields and their new values
+        activities: Activity entries to add to the lead's history
+
+    Side Effects:
+        Queues one line for leads.ndjson (see _append_line)
+    """
+    activity_records = [activity.model_dump() for activity in activities]
+    line = _encode_record({
+        "op": "patch",
+        "id": lead_id,
+        "fields": fields,
+        "activities": activity_records
+    })
+    _append_line("patch", lead_id, line, _activities_size(activity_records))
+
+
+def _activities_size(activity_records: List[Dict]) -> int:
+    """
+    Approximate how much activity entries add to a compacted lead record.
+
+    Parameters:
+        activity_records: Serialized activity entries
+
+    Returns:
+        int: Encoded size of the entries in bytes
+    """
+    return len(_encode_record(activity_records))
+
+
+def _append_line(op: str, lead_id: str, line: bytes, growth: int = 0) -> None:
+    """
+    Queue an encoded record for the end of the log.
+
+    With the background flusher running the record is written on its next
+    pass; otherwise it is flushed before returning. If that flush fails
+    before anything is written, the record is dropped, the cache is
+    reloaded from the log and the error is raised.
+
+    Parameters:
+        op: Operation of the record ("put", "patch" or "del")
+        lead_id: ID of the lead the record applies to
+        line: Encoded record from _encode_record
+        growth: For patches, how much the lead's compacted record grows
+
+    Side Effects:
+        Buffers the line and updates the cached live sizes
+    """
+    with _CACHE_LOCK:
+        _PENDING.append(line)
+
+        record_bytes = _CACHE["record_bytes"]
+        if op == 'put':
+            _CACHE["live_bytes"] += len(line) - record_bytes.get(lead_id, 0)
+            record_bytes[lead_id] = len(line)
+        elif op == 'patch':
+            _CACHE["live_bytes"] += growth
+            record_bytes[lead_id] = record_bytes.get(lead_id, 0) + growth
+        else:
+            _CACHE["live_bytes"] -= record_bytes.pop(lead_id, 0)
+
+        if _FLUSHER is None:
+            try:
+                flush()
+            except Exception as e:
+                if _PENDING == [line]:
+                    # Nothing reached the log: drop the record and replay
+                    # the log into the cache, which undoes the change there
+                    _PENDING.clear()
+                    _CACHE["mtime_ns"] = -1
+                    raise
+                # The record is in the log already, or queued behind others
+                # that are retried on the next flush; it is kept either way,
+                # so don't report the change as failed
+                print(f"Warning: Could not flush leads log: {e}")
+        elif len(_PENDING) >= FLUSH_BATCH:
+            _FLUSH_WAKEUP.set()
+
+
+def _trim_partial_record(f: BinaryIO, size: int) -> int:
+    """
+    Cut an unterminated last record off the end of the log.
+
+    Parameters:
+        f: Log handle, exclusively locked by the caller
+        size: Current size of the log in bytes
+
+    Returns:
+        int: Size of the log afterwards, just past its last newline
+
+    Side Effects:
+        Truncates leads.ndjson if it does not end in a newline
+    """
+    end = size
+    while end > 0:
+        start = max(0, end - 4096)
+        f.seek(start)
+        newline = f.read(end - start).rfind(b"\n")
+        if newline != -1:
+            end = start + newline + 1
+            break
+        end = start
+
+    if end != size:
+        f.truncate(end)
+    return end
+
+
+def flush() -> None:
+    """
+    Write all buffered records to the log in a single append.
+
+    The cache lock is only held to take the records off the queue and to
+    record the result. Writing, syncing and waiting on another process's
+    lock happen under _LOG_LOCK alone, so reads and mutations carry on in
+    the meantime.
+
+    Side Effects:
+        Appends to leads.ndjson, refreshes the cached file state and
+        compacts the log if it has grown too large
+    """
+    global _IN_FLIGHT
+
+    with _CACHE_LOCK:
+        if not _PENDING:
+            return
+
+        # Take the log lock before letting go of the cache lock, so
+        # batches reach the log in the order they were queued
+        _LOG_LOCK.acquire()
+        batch = _PENDING[:]
+        _PENDING.clear()
+        _IN_FLIGHT += 1
 
-    # Atomic write: write to temp file, then rename
-    temp_file = LEADS_FILE.with_suffix('.tmp')
+    written = False
     try:
-        with open(temp_file, 'w') as f:
-            json.dump(leads_data, f, indent=2)
-        temp_file.replace(LEADS_FILE)
-    except Exception as e:
-        if temp_file.exists():
-            temp_file.unlink()
-        raise e
+        try:
+            with _locked_log(exclusive=True) as (f, st):
+                before = (st.st_mtime_ns, st.st_size)
+                end = _trim_partial_record(f, st.st_size)
+
+                # From here on the batch counts as written: retrying it
+                # would append its records twice
+                written = True
+                fd = f.fileno()
+                try:
+                    view = memoryview(b"".join(batch))
+                    while view:
+                        view = view[os.write(fd, view):]
+                except OSError:
+                    # Take back whatever part of the batch got in, so it
+                    # can be queued again
+                    os.ftruncate(fd, end)
+                    written = False
+                    raise
+
+                os.fsync(fd)
+                st = os.fstat(fd)
+        finally:
+            _LOG_LOCK.release()
+    except BaseException:
+        with _CACHE_LOCK:
+            _IN_FLIGHT -= 1
+            if not written:
+                # Retry ahead of anything queued since
+                _PENDING[:0] = batch
+        raise
+
+    with _CACHE_LOCK:
+        _IN_FLIGHT -= 1
+
+        # If anyone else wrote to the log since the cache was filled, the
+        # file no longer matches memory; leave the cache stale so it gets
+        # replayed
+        if before == (_CACHE["mtime_ns"], _CACHE["size"]):
+            _CACHE["mtime_ns"] = st.st_mtime_ns
+            _CACHE["size"] = st.st_size
+        else:
+            _CACHE["mtime_ns"] = -1
+
+        _maybe_compact()
+
+
+def _flush_loop() -> None:
+    """
+    Run the write-behind thread until stop_background_flush() is called.
+
+    Side Effects:
+        Calls flush() every FLUSH_INTERVAL seconds, or sooner when woken,
+        and prints a warning if it fails
+    """
+    while not _FLUSH_STOP.is_set():
+        _FLUSH_WAKEUP.wait(FLUSH_INTERVAL)
+        _FLUSH_WAKEUP.clear()
+        try:
+            flush()
+        except Exception as e:
+            # Records stay queued and are retried on the next pass
+            print(f"Warning: Could not flush leads log: {e}")
+
+
+def start_background_flush() -> None:
+    """
+    Start the write-behind thread so mutations return without disk I/O.
+
+    Side Effects:
+        Starts a daemon thread that periodically calls flush()
+    """
+    global _FLUSHER
+
+    with _CACHE_LOCK:
+        if _FLUSHER is not None:
+            return
+        _FLUSH_STOP.clear()
+        _FLUSHER = threading.Thread(
+            target=_flush_loop, name="leads-log-flush", daemon=True
+        )
+        _FLUSHER.start()
+
+
+def stop_background_flush() -> None:
+    """
+    Stop the write-behind thread and write out anything still buffered.
+
+    Side Effects:
+        Joins the flush thread and flushes pending records
+    """
+    global _FLUSHER
+
+    with _CACHE_LOCK:
+        flusher = _FLUSHER
+        _FLUSHER = None
+
+    if flusher is not None:
+        _FLUSH_STOP.set()
+        _FLUSH_WAKEUP.set()
+        flusher.join()
+
+    flush()
+
+
+def compact() -> None:
+    """
+    Rewrite the log from the in-memory snapshot, one put record per lead.
+
+    Side Effects:
+        Atomically replaces leads.ndjson
+    """
+    global _LOG_FD
+
+    with _CACHE_LOCK:
+        flush()
+
+        # Hold the write lock on the current log so no other process can
+        # append to it between replaying it and replacing it
+        with _locked_log(exclusive=True) as (f, st):
+            _reload_if_stale(f, st)
+            # Forget the handle before rewriting: it is left on the replaced
+            # file, and must not linger closed if the rewrite fails
+            _LOG_FD = None
+            if fcntl is None:
+                # Windows refuses to replace a file that is still open
+                f.close()
+            record_bytes = _write_log(
+                lead.model_dump() for lead in _CACHE["leads"]
+            )
+
+        _CACHE["record_bytes"] = record_bytes
+        _CACHE["live_bytes"] = sum(record_bytes.values())
+
+        # Another process may already have appended to the new file
+        with _locked_log(exclusive=False) as (f, st):
+            if st.st_size == _CACHE["live_bytes"]:
+                _CACHE["mtime_ns"] = st.st_mtime_ns
+                _CACHE["size"] = st.st_size
+            else:
+                _CACHE["mtime_ns"] = -1
+
+
+def _maybe_compact() -> None:
+    """
+    Compact the log once superseded records dominate its size.
+
+    Side Effects:
+        Calls compact() when the log is over COMPACTION_RATIO times the
+        size of its live records
+    """
+    with _CACHE_LOCK:
+        if _CACHE["size"] > COMPACTION_RATIO * _CACHE["live_bytes"]:
+            compact()
 
 
 def get_all_leads() -> List[Lead]:
@@ -174,11 +835,10 @@ def get_lead_by_id(lead_id: str) -> Optional[Lead]:
     Returns:
         Optional[Lead]: The lead if found, None otherwise
     """
-    leads = load_leads()
-    for lead in leads:
-        if lead.id == lead_id:
-            return lead
-    return None
+    with _CACHE_LOCK:
+        _refresh_cache()
+        idx = _CACHE["id_index"].get(lead_id)
+        return _CACHE["leads"][idx] if idx is not None else None
 
 
 def search_leads(query: str) -> List[Lead]:
@@ -195,14 +855,49 @@ def search_leads(query: str) -> List[Lead]:
         return load_leads()
 
     query_lower = query.lower()
-    leads = load_leads()
+    if _SEARCH_SEP in query_lower:
+        return []
+
+    with _CACHE_LOCK:
+        _refresh_cache()
+        leads = _CACHE["leads"]
+        id_index = _CACHE["id_index"]
+        return [
+            leads[id_index[lead_id]]
+            for lead_id in _search_cached(_CACHE["version"], query_lower)
+        ]
+
+
+@lru_cache(maxsize=256)
+def _search_cached(version: int, query_lower: str) -> Tuple[str, ...]:
+    """
+    Find the IDs of leads matching a query, memoized per cache version.
 
-    return [
-        lead for lead in leads
-        if (query_lower in lead.company_name.lower() or
-            query_lower in lead.contact_name.lower() or
-            query_lower in lead.email.lower())
-    ]
+    Callers must hold the cache lock with the cache at `version`. Results
+    for older versions are never looked up again and age out of the LRU.
+
+    Parameters:
+        version: Current cache version
+        query_lower: Lowercased search term
+
+    Returns:
+        Tuple[str, ...]: IDs of matching leads, in lead order
+    """
+    leads = _CACHE["leads"]
+    joined, offsets = _search_buffer()
+    needle = query_lower.encode()
+
+    # Let bytes.find() scan the whole buffer; after each hit map it back
+    # to its lead and resume at the next lead's blob
+    results = []
+    pos = joined.find(needle)
+    while pos >= 0:
+        i = bisect_right(offsets, pos) - 1
+        results.append(leads[i].id)
+        if i + 1 >= len(offsets):
+            break
+        pos = joined.find(needle, offsets[i + 1])
+    return tuple(results)
 
 
 def check_duplicate_email(email: str, exclude_id: Optional[str] = None) -> bool:
@@ -216,14 +911,10 @@ def check_duplicate_email(email: str, exclude_id: Optional[str] = None) -> bool:
     Returns:
         bool: True if email exists, False otherwise
     """
-    leads = load_leads()
-    email_lower = email.lower()
-
-    for lead in leads:
-        if lead.email.lower() == email_lower and lead.id != exclude_id:
-            return True
-
-    return False
+    with _CACHE_LOCK:
+        _refresh_cache()
+        owners = _CACHE["email_index"].get(email.lower(), ())
+        return any(owner != exclude_id for owner in owners)
 
 
 def create_lead(lead_data: LeadCreate) -> Lead:
@@ -237,10 +928,25 @@ def create_lead(lead_data: LeadCreate) -> Lead:
         Lead: The created lead with generated ID and timestamp
 
     Side Effects:
-        Adds lead to JSON file
+        Appends a put record to the leads log
+    """
+    with _CACHE_LOCK:
+        _refresh_cache()
+        return _create_lead_locked(lead_data)
+
+
+def _create_lead_locked(lead_data: LeadCreate) -> Lead:
     """
-    leads = load_leads()
+    Create a new lead without refreshing the cache first.
 
+    The caller must hold _CACHE_LOCK and have refreshed the cache.
+
+    Parameters:
+        lead_data: Lead data to create
+
+    Returns:
+        Lead: The created lead with generated ID and timestamp
+    """
     # Create initial activity
     now = datetime.now()
     initial_activity = Activity(
@@ -259,8 +965,16 @@ def create_lead(lead_data: LeadCreate) -> Lead:
         **lead_data.model_dump()
     )
 
+    leads = _CACHE["leads"]
     leads.append(new_lead)
-    save_leads(leads)
+    _CACHE["search_blobs"].append(_search_blob(new_lead))
+    _CACHE["search_joined"] = None
+    _CACHE["version"] += 1
+    _index_lead(_CACHE, new_lead)
+    _CACHE["id_index"][new_lead.id] = len(leads) - 1
+
+    # Log last: writing may flush and reload or compact the cache
+    append_record("put", new_lead)
 
     return new_lead
 
@@ -277,88 +991,129 @@ def update_lead(lead_id: str, lead_data: LeadUpdate) -> Optional[Lead]:
         Optional[Lead]: Updated lead if found, None otherwise
 
     Side Effects:
-        Updates lead in JSON file
-    """
-    leads = load_leads()
-
-    for i, lead in enumerate(leads):
-        if lead.id == lead_id:
-            now = datetime.now()
-
-            # Track what changed
-            activities = list(lead.activity_history)
-
-            # Check for status change
-            if lead_data.status != lead.status:
-                activities.append(Activity(
-                    timestamp=now,
-                    type=ActivityType.STATUS_CHANGED,
-                    description=f"Status changed from {lead.status.value} to {lead_data.status.value}",
-                    details=None
-                ))
-
-                # Update last_contacted if status changed to contacted or responded
-                if lead_data.status.value in ['contacted', 'responded']:
-                    last_contacted = now
-                else:
-                    last_contacted = lead.last_contacted
-            else:
-                last_contacted = lead.last_contacted
-
-            # Check for notes change
-            if lead_data.notes and lead_data.notes != lead.notes:
-                activities.append(Activity(
-                    timestamp=now,
-                    type=ActivityType.NOTE_ADDED,
-                    description="Note updated",
-                    details=lead_data.notes[:100]
-                ))
-
-            # Check for tag changes
-            old_tags = set(lead.tags)
-            new_tags = set(lead_data.tags)
-
-            added_tags = new_tags - old_tags
-            removed_tags = old_tags - new_tags
-
-            for tag in added_tags:
-                activities.append(Activity(
-                    timestamp=now,
-                    type=ActivityType.TAG_ADDED,
-                    description=f"Tag added: {tag}",
-                    details=None
-                ))
-
-            for tag in removed_tags:
-                activities.append(Activity(
-                    timestamp=now,
-                    type=ActivityType.TAG_REMOVED,
-                    description=f"Tag removed: {tag}",
-                    details=None
-                ))
-
-            # General update activity if something changed
-            if not (activities[-1:] and activities[-1].type in [ActivityType.STATUS_CHANGED, ActivityType.NOTE_ADDED, ActivityType.TAG_ADDED, ActivityType.TAG_REMOVED]):
-                activities.append(Activity(
-                    timestamp=now,
-                    type=ActivityType.UPDATED,
-                    description="Lead information updated",
-                    details=None
-                ))
-
-            # Preserve original ID and date_added
-            updated_lead = Lead(
-                id=lead.id,
-                date_added=lead.date_added,
-                last_contacted=last_contacted,
-                activity_history=activities,
-                **lead_data.model_dump()
-            )
-            leads[i] = updated_lead
-            save_leads(leads)
-            return updated_lead
+        Appends a patch record to the leads log
+    """
+    with _CACHE_LOCK:
+        _refresh_cache()
+        return _update_lead_locked(lead_id, lead_data)
+
+
+def _update_lead_locked(lead_id: str, lead_data: LeadUpdate) -> Optional[Lead]:
+    """
+    Update an existing lead without refreshing the cache first.
+
+    The caller must hold _CACHE_LOCK and have refreshed the cache.
+
+    Parameters:
+        lead_id: ID of the lead to update
+        lead_data: New lead data
+
+    Returns:
+        Optional[Lead]: Updated lead if found, None otherwise
+    """
+    leads = _CACHE["leads"]
+    i = _CACHE["id_index"].get(lead_id)
+    if i is None:
+        return None
+
+    lead = leads[i]
+
+    # The UI often PUTs a lead back unchanged; nothing to record then
+    new_data = lead_data.model_dump()
+    old_data = {key: getattr(lead, key) for key in new_data}
+    if new_data == old_data:
+        return lead
+
+    now = datetime.now()
 
-    return None
+    # Track what changed
+    activities = list(lead.activity_history)
+
+    # Check for status change
+    if lead_data.status != lead.status:
+        activities.append(Activity(
+            timestamp=now,
+            type=ActivityType.STATUS_CHANGED,
+            description=f"Status changed from {lead.status.value} to {lead_data.status.value}",
+            details=None
+        ))
+
+        # Update last_contacted if status changed to contacted or responded
+        if lead_data.status.value in ['contacted', 'responded']:
+            last_contacted = now
+        else:
+            last_contacted = lead.last_contacted
+    else:
+        last_contacted = lead.last_contacted
+
+    # Check for notes change
+    if lead_data.notes and lead_data.notes != lead.notes:
+        activities.append(Activity(
+            timestamp=now,
+            type=ActivityType.NOTE_ADDED,
+            description="Note updated",
+            details=lead_data.notes[:100]
+        ))
+
+    # Check for tag changes
+    old_tags = frozenset(lead.tags)
+    new_tags = frozenset(lead_data.tags)
+
+    added_tags = new_tags - old_tags
+    removed_tags = old_tags - new_tags
+
+    for tag in added_tags:
+        activities.append(Activity(
+            timestamp=now,
+            type=ActivityType.TAG_ADDED,
+            description=f"Tag added: {tag}",
+            details=None
+        ))
+
+    for tag in removed_tags:
+        activities.append(Activity(
+            timestamp=now,
+            type=ActivityType.TAG_REMOVED,
+            description=f"Tag removed: {tag}",
+            details=None
+        ))
+
+    # General update activity if something changed
+    if not (activities[-1:] and activities[-1].type in [ActivityType.STATUS_CHANGED, ActivityType.NOTE_ADDED, ActivityType.TAG_ADDED, ActivityType.TAG_REMOVED]):
+        activities.append(Activity(
+            timestamp=now,
+            type=ActivityType.UPDATED,
+            description="Lead information updated",
+            details=None
+        ))
+
+    # Preserve original ID and date_added. lead_data was validated when
+    # the request was parsed, so copy rather than re-validate; the old
+    # lead is left intact for unindexing below.
+    updated_lead = lead.model_copy(update={
+        **new_data,
+        "last_contacted": last_contacted,
+        "activity_history": activities,
+    })
+
+    leads[i] = updated_lead
+    _CACHE["search_blobs"][i] = _search_blob(updated_lead)
+    _CACHE["search_joined"] = None
+    _CACHE["version"] += 1
+    _unindex_lead(_CACHE, lead)
+    _index_lead(_CACHE, updated_lead)
+
+    # Persist only what changed, plus the new history entries. Log
+    # last: writing may flush and reload or compact the cache.
+    fields = {
+        key: value
+        for key, value in new_data.items()
+        if old_data[key] != value
+    }
+    if last_contacted != lead.last_contacted:
+        fields['last_contacted'] = last_contacted
+    append_patch(lead.id, fields, activities[len(lead.activity_history):])
+    return updated_lead
 
 
 def delete_lead(lead_id: str) -> bool:
@@ -372,18 +1127,83 @@ def delete_lead(lead_id: str) -> bool:
         bool: True if lead was deleted, False if not found
 
     Side Effects:
-        Removes lead from JSON file
+        Appends a del record to the leads log
     """
-    leads = load_leads()
-    initial_count = len(leads)
+    with _CACHE_LOCK:
+        _refresh_cache()
+        leads = _CACHE["leads"]
+        idx = _CACHE["id_index"].get(lead_id)
+        if idx is None:
+            return False
+
+        lead = leads[idx]
+        del leads[idx]
+        del _CACHE["search_blobs"][idx]
+        _CACHE["search_joined"] = None
+        _CACHE["version"] += 1
+        _unindex_lead(_CACHE, lead)
+
+        # Leads after the removed one shift down a slot
+        id_index = _CACHE["id_index"]
+        del id_index[lead_id]
+        for j in range(idx, len(leads)):
+            id_index[leads[j].id] = j
 
-    leads = [lead for lead in leads if lead.id != lead_id]
+        # Log last: writing may flush and reload or compact the cache
+        append_record("del", lead)
 
-    if len(leads) < initial_count:
-        save_leads(leads)
-        return True
+    return True
 
-    return False
+
+def create_lead_checked(lead_data: LeadCreate) -> Tuple[Lead, Optional[str]]:
+    """
+    Create a new lead, checking for a duplicate email in the same step.
+
+    Parameters:
+        lead_data: Lead data to create
+
+    Returns:
+        Tuple[Lead, Optional[str]]: The created lead and a warning if its
+            email was already in use
+
+    Side Effects:
+        Appends a put record to the leads log
+    """
+    with _CACHE_LOCK:
+        _refresh_cache()
+        warning = None
+        if lead_data.email.lower() in _CACHE["email_index"]:
+            warning = f"Warning: A lead with email {lead_data.email} already exists"
+        return _create_lead_locked(lead_data), warning
+
+
+def update_lead_checked(
+    lead_id: str, lead_data: LeadUpdate
+) -> Tuple[Optional[Lead], Optional[str]]:
+    """
+    Update an existing lead, checking for a duplicate email in the same step.
+
+    Parameters:
+        lead_id: ID of the lead to update
+        lead_data: New lead data
+
+    Returns:
+        Tuple[Optional[Lead], Optional[str]]: The updated lead (None if not
+            found) and a warning if another lead already uses the email
+
+    Side Effects:
+        Appends a patch record to the leads log
+    """
+    with _CACHE_LOCK:
+        _refresh_cache()
+        if lead_id not in _CACHE["id_index"]:
+            return None, None
+
+        warning = None
+        owners = _CACHE["email_index"].get(lead_data.email.lower(), ())
+        if any(owner != lead_id for owner in owners):
+            warning = f"Warning: Another lead with email {lead_data.email} already exists"
+        return _update_lead_locked(lead_id, lead_data), warning
 
 
 def get_stats() -> Dict:
@@ -393,36 +1213,26 @@ def get_stats() -> Dict:
     Returns:
         Dict: Statistics including total count, status breakdown, and company counts
     """
-    leads = load_leads()
-
-    # Count by status
-    status_counts = {
-        "not_contacted": 0,
-        "contacted": 0,
-        "responded": 0
-    }
+    with _CACHE_LOCK:
+        _refresh_cache()
+
+        return {
+            "total": len(_CACHE["leads"]),
+            "by_status": dict(_CACHE["status_counts"]),
+            "top_companies": [
+                {"company": company, "count": count}
+                for company, count in _CACHE["company_counts"].most_common(5)
+            ]
+        }
 
-    # Count by company
-    company_counts = {}
 
-    for lead in leads:
-        status_counts[lead.status.value] += 1
-        company_counts[lead.company_name] = company_counts.get(
-            lead.company_name, 0
-        ) + 1
-
-    # Get top 5 companies
-    top_companies = sorted(
-        company_counts.items(),
-        key=lambda x: x[1],
-        reverse=True
-    )[:5]
+def get_tag_counts() -> Counter:
+    """
+    Get how many leads use each tag.
 
-    return {
-        "total": len(leads),
-        "by_status": status_counts,
-        "top_companies": [
-            {"company": company, "count": count}
-            for company, count in top_companies
-        ]
-    }
+    Returns:
+        Counter: Usage count keyed by tag name
+    """
+    with _CACHE_LOCK:
+        _refresh_cache()
+        return Counter(_CACHE["tag_counts"])
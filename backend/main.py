@@ -6,7 +6,7 @@ including CRUD operations, search, export, and statistics.
 """
 
 from fastapi import FastAPI, HTTPException, Query, Request
-from fastapi.responses import Response, FileResponse, JSONResponse
+from fastapi.responses import Response, FileResponse, JSONResponse, ORJSONResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
 from typing import List, Optional
@@ -31,16 +31,19 @@ async def lifespan(app: FastAPI):
         db.ensure_data_file_exists()
     except Exception as e:
         print(f"Warning: Could not initialize database: {e}")
+    db.start_background_flush()
     yield
     # Shutdown
-    pass
+    db.stop_background_flush()
 
 
 app = FastAPI(
     title="Lead Tracking System",
     description="Simple lead management system with JSON storage",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    # Render responses with orjson (C encoder) instead of the stdlib json module
+    default_response_class=ORJSONResponse
 )
 
 # Add CORS middleware for local development
@@ -163,15 +166,8 @@ async def create_lead(lead_data: LeadCreate):
         HTTPException: If validation fails (400) or server error (500)
     """
     try:
-        # Check for duplicate email
-        is_duplicate = db.check_duplicate_email(lead_data.email)
-        warning = None
-
-        if is_duplicate:
-            warning = f"Warning: A lead with email {lead_data.email} already exists"
-
-        # Create the lead
-        new_lead = db.create_lead(lead_data)
+        # Create the lead, flagging a duplicate email
+        new_lead, warning = db.create_lead_checked(lead_data)
 
         return LeadResponse(lead=new_lead, warning=warning)
 
@@ -197,21 +193,11 @@ async def update_lead(lead_id: str, lead_data: LeadUpdate):
         HTTPException: If lead not found (404) or validation fails (400)
     """
     try:
-        # Check if lead exists
-        existing_lead = db.get_lead_by_id(lead_id)
-        if not existing_lead:
+        # Update the lead, flagging an email used by another lead
+        updated_lead, warning = db.update_lead_checked(lead_id, lead_data)
+        if not updated_lead:
             raise HTTPException(status_code=404, detail="Lead not found")
 
-        # Check for duplicate email (excluding current lead)
-        is_duplicate = db.check_duplicate_email(lead_data.email, exclude_id=lead_id)
-        warning = None
-
-        if is_duplicate:
-            warning = f"Warning: Another lead with email {lead_data.email} already exists"
-
-        # Update the lead
-        updated_lead = db.update_lead(lead_id, lead_data)
-
         return LeadResponse(lead=updated_lead, warning=warning)
 
     except HTTPException:
@@ -245,14 +231,13 @@ async def export_leads():
     Export all leads as CSV file.
 
     Returns:
-        Response: CSV file download
+        StreamingResponse: CSV file download, sent row by row
     """
     try:
         leads = db.get_all_leads()
-        csv_content = utils.export_leads_to_csv(leads)
 
-        return Response(
-            content=csv_content,
+        return StreamingResponse(
+            utils.iter_leads_csv(leads),
             media_type="text/csv",
             headers={
                 "Content-Disposition": "attachment; filename=leads_export.csv"
@@ -287,16 +272,11 @@ async def get_all_tags():
         dict: List of all unique tags with usage count
     """
     try:
-        leads = db.get_all_leads()
-        tag_counts = {}
-
-        for lead in leads:
-            for tag in lead.tags:
-                tag_counts[tag] = tag_counts.get(tag, 0) + 1
+        tag_counts = db.get_tag_counts()
 
         tags = [
             {"name": tag, "count": count}
-            for tag, count in sorted(tag_counts.items(), key=lambda x: x[1], reverse=True)
+            for tag, count in tag_counts.most_common()
         ]
 
         return {"tags": tags}
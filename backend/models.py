@@ -12,6 +12,10 @@ from pydantic import BaseModel, Field, field_validator
 import re
 
 
+# Accepted email format (name@company.com)
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+
 class ActivityType(str, Enum):
     """
     Enumeration of activity types for lead history.
@@ -106,8 +110,7 @@ class LeadBase(BaseModel):
         Raises:
             ValueError: If email format is invalid
         """
-        email_pattern = r'^[a-zA-Z0-9._-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        if not re.match(email_pattern, v):
+        if not _EMAIL_RE.match(v):
             raise ValueError(
                 'Email must be in format name@company.com'
             )
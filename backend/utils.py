@@ -7,39 +7,46 @@ CSV export, and other utility operations.
 
 import csv
 import io
-from typing import List
+from typing import Iterable, Iterator, List
 from models import Lead
 
 
-def export_leads_to_csv(leads: List[Lead]) -> str:
+# CSV column headers, in output order
+CSV_FIELDNAMES = [
+    'ID',
+    'Company Name',
+    'Contact Name',
+    'Title',
+    'Email',
+    'LinkedIn URL',
+    'Date Added',
+    'Status',
+    'Notes'
+]
+
+
+def iter_leads_csv(leads: Iterable[Lead]) -> Iterator[str]:
     """
-    Export leads to CSV format.
+    Generate CSV output for leads one line at a time.
+
+    A single small buffer is reused for every row, so memory use does not
+    grow with the number of leads.
 
     Parameters:
-        leads: List of leads to export
+        leads: Leads to export
 
-    Returns:
-        str: CSV-formatted string of all leads
+    Yields:
+        str: The header line, then one CSV line per lead
     """
-    output = io.StringIO()
-
-    # Define CSV headers
-    fieldnames = [
-        'ID',
-        'Company Name',
-        'Contact Name',
-        'Title',
-        'Email',
-        'LinkedIn URL',
-        'Date Added',
-        'Status',
-        'Notes'
-    ]
-
-    writer = csv.DictWriter(output, fieldnames=fieldnames)
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=CSV_FIELDNAMES)
+
     writer.writeheader()
+    yield buffer.getvalue()
 
     for lead in leads:
+        buffer.seek(0)
+        buffer.truncate(0)
         writer.writerow({
             'ID': lead.id,
             'Company Name': lead.company_name,
@@ -51,8 +58,20 @@ def export_leads_to_csv(leads: List[Lead]) -> str:
             'Status': lead.status.value,
             'Notes': lead.notes
         })
+        yield buffer.getvalue()
+
 
-    return output.getvalue()
+def export_leads_to_csv(leads: List[Lead]) -> str:
+    """
+    Export leads to CSV format.
+
+    Parameters:
+        leads: List of leads to export
+
+    Returns:
+        str: CSV-formatted string of all leads
+    """
+    return ''.join(iter_leads_csv(leads))
 
 
 def format_status_display(status: str) -> str: